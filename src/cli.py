@@ -12,6 +12,7 @@ from .monitor import AFLMonitor
 from .process import ProcessMonitor
 from .output_terminal import TerminalOutput
 from .utils import get_timestamp
+from . import constants
 
 
 def setup_logging(verbose: bool):
@@ -30,6 +31,7 @@ def setup_logging(verbose: bool):
 @click.option('-w', '--web', 'web_server', is_flag=True, help='Start web server with live dashboard')
 @click.option('-p', '--port', 'web_port', default=8080, help='Web server port (default: 8080)')
 @click.option('--headless', is_flag=True, help='Run web server in headless mode (without TUI)')
+@click.option('--no-uvloop', is_flag=True, help='Use the standard asyncio event loop for the web server')
 @click.option('-v', '--verbose', is_flag=True, help='Show detailed per-fuzzer statistics')
 @click.option('-n', '--no-color', is_flag=True, help='Disable colored output')
 @click.option('-i', '--interval', default=1, help='Refresh interval in seconds (default: 1)')
@@ -105,12 +107,15 @@ def main(**kwargs):
         if not wants_headless:
             from .webserver import start_web_server_background
             from .tui import run_interactive_tui
+            web_process = None
             try:
-                # Start web server in background thread
-                web_thread = start_web_server_background(
+                # Start web server in background process
+                web_process = start_web_server_background(
                     findings_dir=Path(kwargs['findings_directory']),
                     port=kwargs['web_port'],
-                    refresh_interval=kwargs['interval']
+                    refresh_interval=kwargs['interval'],
+                    use_uvloop=not kwargs['no_uvloop'],
+                    log_level=logging.getLogger().getEffectiveLevel()
                 )
                 # Run TUI in main thread (required for signal handling)
                 run_interactive_tui(
@@ -125,16 +130,21 @@ def main(**kwargs):
                     import traceback
                     traceback.print_exc()
                 sys.exit(1)
+            finally:
+                # SIGTERM lets the web server close its sockets and clean up
+                if web_process is not None and web_process.is_alive():
+                    web_process.terminate()
+                    web_process.join(constants.WEB_SHUTDOWN_TIMEOUT)
         else:
             # Headless mode - run web server in main async context
-            from .webserver import run_web_server
+            from .webserver import run_web_server, run_event_loop
             try:
-                asyncio.run(run_web_server(
+                run_event_loop(run_web_server(
                     findings_dir=Path(kwargs['findings_directory']),
                     port=kwargs['web_port'],
                     headless=True,
                     refresh_interval=kwargs['interval']
-                ))
+                ), use_uvloop=not kwargs['no_uvloop'])
             except KeyboardInterrupt:
                 click.echo("\n\nShutting down...")
             except Exception as e:
@@ -6,6 +6,7 @@ from __future__ import annotations
 FUZZER_STARTING_AGE_THRESHOLD = 60  # Consider fuzzer starting if setup file modified within this time
 FUZZER_STARTING_CHECK_WINDOW = 300  # Only check fuser for recent setups (5 minutes)
 FUSER_TIMEOUT = 0.5  # Timeout for fuser command (seconds)
+SYSTEM_INFO_TTL = 0.5  # Reuse CPU/memory/disk readings younger than this (seconds); kept below the 1s minimum refresh interval
 
 # Performance warning thresholds
 TIMEOUT_RATIO_THRESHOLD = 10.0  # High timeout ratio percentage
@@ -31,6 +32,14 @@ STATE_LOCK_FILE_NAME = ".afl-monitor-ng.lock"
 # Default configuration
 DEFAULT_REFRESH_INTERVAL = 1  # Default refresh interval in seconds
 DEFAULT_WEB_PORT = 8080  # Default web server port
+WEB_KEEPALIVE_TIMEOUT = 75  # Seconds to keep idle dashboard connections open between polls
+WEB_WS_HEARTBEAT = 30  # Seconds between pings on dashboard WebSocket connections
+WEB_SHUTDOWN_TIMEOUT = 5  # Seconds to wait for the web server process to exit
+WEB_GZIP_MIN_SIZE = 1024  # Smallest JSON body worth gzipping (bytes)
+WEB_GZIP_LEVEL = 1  # Fast gzip level for per-snapshot JSON bodies
+WEB_FLOAT_DIGITS = 2  # Decimal places kept for floats in stats payloads
+WEB_ROW_CACHE_SIZE = 1024  # Rendered fuzzer table rows kept for reuse
+WEB_STATE_SAVE_INTERVAL = 30  # Minimum seconds between campaign state file writes
 
 # Display formatting
 MAX_SUMMARY_UNITS = 2  # Maximum time units to show in duration formatting
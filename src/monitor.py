@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import copy
 import time
-import json
 import threading
 import fcntl
 from pathlib import Path
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+import orjson
+
 from .models import FuzzerStats, CampaignSummary, MonitorConfig
 from .parser import FuzzerStatsParser, PlotDataParser, discover_fuzzers
 from .process import ProcessMonitor, ProcessValidator
@@ -33,6 +35,16 @@ class AFLMonitor:
         self.state_file = Path.home() / constants.STATE_FILE_NAME
         self.state_lock_file = Path.home() / constants.STATE_LOCK_FILE_NAME
 
+        # Parsed fuzzer_stats keyed by file path, tagged with the (mtime_ns, size)
+        # they were parsed at; unchanged files are not re-read on the next poll
+        self._parse_cache: Dict[Path, Tuple[Tuple[int, int], FuzzerStats]] = {}
+        self._parse_cache_lock = threading.Lock()
+
+        # Worker pool reused across collections instead of spawning threads per
+        # refresh; created on first use since single-fuzzer campaigns never need it
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
     def collect_stats(self) -> tuple[List[FuzzerStats], CampaignSummary]:
         """
         Collect statistics from all fuzzers using parallel processing.
@@ -46,46 +58,74 @@ class AFLMonitor:
 
         if not fuzzer_dirs:
             logger.warning(f"No fuzzers found in {self.config.findings_dir}")
+            ProcessMonitor.prune_processes(set())
             return [], CampaignSummary()
 
+        # Forget cached parses of fuzzers that have disappeared
+        with self._parse_cache_lock:
+            live_files = {fuzzer_dir / "fuzzer_stats" for fuzzer_dir in fuzzer_dirs}
+            for stale in self._parse_cache.keys() - live_files:
+                del self._parse_cache[stale]
+
         # Parse each fuzzer in parallel for better performance
         if len(fuzzer_dirs) > 1:
-            # Limit workers to avoid overwhelming the system
-            max_workers = min(len(fuzzer_dirs), constants.MAX_WORKER_THREADS)
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all tasks and collect futures (no shared state mutation)
-                futures = [
-                    executor.submit(self._collect_fuzzer_stats, fuzzer_dir)
-                    for fuzzer_dir in fuzzer_dirs
-                ]
-
-                # Collect results safely - each thread returns, main thread collects
-                all_stats = []
-                for future in as_completed(futures):
-                    try:
-                        stats = future.result()
-                        if stats and (stats.is_alive or self.config.show_dead):
-                            all_stats.append(stats)
-                    except Exception as e:
-                        logger.error(f"Error collecting stats: {e}")
+            executor = self._get_executor()
+            # Submit all tasks and collect futures (no shared state mutation)
+            futures = [
+                executor.submit(self._collect_fuzzer_stats, fuzzer_dir)
+                for fuzzer_dir in fuzzer_dirs
+            ]
+
+            # Collect results safely - each thread returns, main thread collects.
+            # Results are taken in submission order so the output stays sorted.
+            all_stats = []
+            for future in futures:
+                try:
+                    stats = future.result()
+                    if stats and (stats.is_alive or self.config.show_dead):
+                        all_stats.append(stats)
+                except Exception as e:
+                    logger.error(f"Error collecting stats: {e}")
         else:
             # Single fuzzer, no need for threading
             stats = self._collect_fuzzer_stats(fuzzer_dirs[0])
             all_stats = [stats] if stats and (stats.is_alive or self.config.show_dead) else []
 
+        # Forget process handles of fuzzers that exited or restarted under a new PID
+        ProcessMonitor.prune_processes({stats.fuzzer_pid for stats in all_stats})
+
         # Create summary
         summary = self._create_summary(all_stats)
 
         return all_stats, summary
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared worker pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                # Limit workers to avoid overwhelming the system; threads are
+                # only started as the pool needs them
+                self._executor = ThreadPoolExecutor(
+                    max_workers=constants.MAX_WORKER_THREADS,
+                    thread_name_prefix="afl-monitor",
+                )
+            return self._executor
+
+    def close(self):
+        """Shut down the worker pool. A later collect_stats() starts a new one."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
     def _collect_fuzzer_stats(self, fuzzer_dir: Path) -> Optional[FuzzerStats]:
         """Collect stats for a single fuzzer."""
         try:
             fuzzer_name = fuzzer_dir.name
             stats_file = fuzzer_dir / "fuzzer_stats"
 
-            # Parse stats file
-            stats = FuzzerStatsParser.parse_file(stats_file, fuzzer_name)
+            # Parse stats file (or reuse the last parse if it has not changed)
+            stats = self._parse_fuzzer_stats(stats_file, fuzzer_name)
             if not stats:
                 return None
 
@@ -103,6 +143,32 @@ class AFLMonitor:
             logger.error(f"Error collecting stats for {fuzzer_dir}: {e}")
             return None
 
+    def _parse_fuzzer_stats(self, stats_file: Path, fuzzer_name: str) -> Optional[FuzzerStats]:
+        """
+        Parse a fuzzer_stats file, reusing the cached result if it is unchanged.
+
+        Returns a copy, since callers fill in process status and resource usage.
+        """
+        try:
+            st = stats_file.stat()
+        except OSError:
+            # Let the parser report the missing/unreadable file
+            return FuzzerStatsParser.parse_file(stats_file, fuzzer_name)
+
+        key = (st.st_mtime_ns, st.st_size)
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(stats_file)
+        if cached is not None and cached[0] == key:
+            return copy.copy(cached[1])
+
+        stats = FuzzerStatsParser.parse_file(stats_file, fuzzer_name)
+        if stats is None:
+            return None
+
+        with self._parse_cache_lock:
+            self._parse_cache[stats_file] = (key, stats)
+        return copy.copy(stats)
+
     def _create_summary(self, all_stats: List[FuzzerStats]) -> CampaignSummary:
         """Create campaign summary from all fuzzer stats."""
         summary = CampaignSummary()
@@ -186,12 +252,12 @@ class AFLMonitor:
                     return
 
                 # Read state file with shared lock
-                with open(self.state_file, 'r', encoding='utf-8') as f:
+                with open(self.state_file, 'rb') as f:
                     try:
                         # Try to acquire shared lock (multiple readers OK)
                         fcntl.flock(f.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
                         try:
-                            data = json.load(f)
+                            data = orjson.loads(f.read())
                             new_summary = CampaignSummary(**data.get('summary', {}))
 
                             # Atomic update to instance variable
@@ -203,7 +269,7 @@ class AFLMonitor:
                     except BlockingIOError:
                         logger.debug("State file locked by another process, skipping load")
         except Exception as e:
-            logger.debug(f"Could not load previous state: {e}")
+            logger.debug("Could not load previous state: %s", e)
             with self._summary_lock:
                 self._previous_summary = None
 
@@ -225,12 +291,12 @@ class AFLMonitor:
 
                 try:
                     # Write to temp file with exclusive lock
-                    with open(temp_file, 'w', encoding='utf-8') as f:
+                    with open(temp_file, 'wb') as f:
                         try:
                             # Acquire exclusive lock (no readers/writers allowed)
                             fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
                             try:
-                                json.dump(data, f, indent=2)
+                                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
                                 f.flush()
                                 # Atomic rename (POSIX guarantee)
                                 temp_file.replace(self.state_file)
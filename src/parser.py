@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -18,28 +19,30 @@ class FuzzerStatsParser:
     def parse_file(stats_file: Path, fuzzer_name: str) -> Optional[FuzzerStats]:
         """Parse a fuzzer_stats file into FuzzerStats object."""
         try:
-            if not stats_file.exists():
-                logger.warning(f"Stats file not found: {stats_file}")
-                return None
+            # One read and one split per file; the missing-file case is handled
+            # below instead of with a separate exists() stat
+            with open(stats_file, 'r', encoding='utf-8', errors='ignore') as f:
+                text = f.read()
 
             data = {}
-            with open(stats_file, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or ':' not in line:
-                        continue
+            for line in text.splitlines():
+                key, sep, value = line.partition(':')
+                if not sep:
+                    continue
 
-                    key, _, value = line.partition(':')
-                    key = key.strip()
-                    value = value.strip()
+                key = key.strip()
+                value = value.strip()
 
-                    if key and value:
-                        data[key] = value
+                if key and value:
+                    data[key] = value
 
             return FuzzerStatsParser._create_stats_object(
                 data, stats_file.parent, fuzzer_name
             )
 
+        except FileNotFoundError:
+            logger.warning(f"Stats file not found: {stats_file}")
+            return None
         except Exception as e:
             logger.error(f"Error parsing {stats_file}: {e}")
             return None
@@ -190,7 +193,7 @@ class PlotDataParser:
                 servers_count=int(parts[14]),
             )
         except (ValueError, IndexError) as e:
-            logger.debug(f"Could not parse plot line: {line} - {e}")
+            logger.debug("Could not parse plot line: %s - %s", line, e)
             return None
 
     @staticmethod
@@ -246,16 +249,19 @@ def discover_fuzzers(sync_dir: Path) -> List[Path]:
     except (PermissionError, OSError) as e:
         logger.warning(f"Cannot check for fuzzer_stats in {sync_dir}: {e}")
 
-    # This is a sync directory - find all subdirectories with fuzzer_stats
+    # This is a sync directory - find all subdirectories with fuzzer_stats.
+    # scandir reports the entry type from the directory listing itself, so
+    # non-directories are skipped without a stat() call each.
     try:
-        for item in sync_dir.iterdir():
-            try:
-                if item.is_dir() and (item / "fuzzer_stats").exists():
-                    fuzzers.append(item)
-                    logger.debug(f"Found fuzzer: {item.name}")
-            except (PermissionError, OSError) as e:
-                logger.warning(f"Cannot access fuzzer directory {item}: {e}")
-                continue
+        with os.scandir(sync_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir() and os.path.exists(os.path.join(entry.path, "fuzzer_stats")):
+                        fuzzers.append(sync_dir / entry.name)
+                        logger.debug("Found fuzzer: %s", entry.name)
+                except (PermissionError, OSError) as e:
+                    logger.warning(f"Cannot access fuzzer directory {entry.path}: {e}")
+                    continue
     except (PermissionError, OSError) as e:
         logger.error(f"Cannot iterate directory {sync_dir}: {e}")
         return fuzzers
@@ -6,8 +6,9 @@ import logging
 import os
 import subprocess
 import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Set, Tuple
 
 import psutil
 
@@ -23,6 +24,18 @@ class ProcessMonitor:
     # Class-level lock for psutil CPU calls (shared state in psutil)
     _cpu_lock = threading.Lock()
 
+    # Logical CPU count never changes while we run; looked up once on first use
+    _cpu_count: Optional[int] = None
+
+    # Last system reading and when it was taken; callers polling faster than
+    # SYSTEM_INFO_TTL share it instead of querying psutil again
+    _system_info: Optional[dict] = None
+    _system_info_ts: float = 0.0
+
+    # psutil.Process handles by PID, reused across polls so cpu_percent(interval=0)
+    # measures against the previous poll instead of returning 0.0 for a fresh handle
+    _processes: Dict[int, psutil.Process] = {}
+
     @staticmethod
     def check_process_status(
         pid: int, fuzzer_dir: Path
@@ -42,6 +55,7 @@ class ProcessMonitor:
 
         # Check if process exists
         if not ProcessMonitor._is_process_alive(pid):
+            ProcessMonitor._processes.pop(pid, None)
             # Check if starting
             if ProcessMonitor._is_fuzzer_starting(fuzzer_dir):
                 return FuzzerStatus.STARTING, 0.0, 0.0
@@ -51,6 +65,12 @@ class ProcessMonitor:
         cpu, mem = ProcessMonitor._get_process_resources(pid)
         return FuzzerStatus.ALIVE, cpu, mem
 
+    @staticmethod
+    def prune_processes(live_pids: Set[int]):
+        """Drop cached process handles for PIDs no longer reported by any fuzzer."""
+        for pid in ProcessMonitor._processes.keys() - live_pids:
+            ProcessMonitor._processes.pop(pid, None)
+
     @staticmethod
     def _is_process_alive(pid: int) -> bool:
         """Check if process is alive using kill -0."""
@@ -64,7 +84,7 @@ class ProcessMonitor:
             # Process exists but we don't have permission
             return True
         except Exception as e:
-            logger.debug(f"Error checking process {pid}: {e}")
+            logger.debug("Error checking process %s: %s", pid, e)
             return False
 
     @staticmethod
@@ -112,40 +132,52 @@ class ProcessMonitor:
             return False
 
         except Exception as e:
-            logger.debug(f"Error checking startup status for {fuzzer_dir}: {e}")
+            logger.debug("Error checking startup status for %s: %s", fuzzer_dir, e)
             return False
 
     @staticmethod
     def _get_process_resources(pid: int) -> Tuple[float, float]:
         """Get CPU and memory usage for a process (thread-safe)."""
         try:
-            process = psutil.Process(pid)
+            process = ProcessMonitor._processes.get(pid)
+            if process is None:
+                process = ProcessMonitor._processes[pid] = psutil.Process(pid)
 
-            # Get CPU usage (percentage) - use interval=0 for instant cached reading
-            # This is much faster than interval=0.1 which blocks for 100ms per process
-            # Thread-safe: psutil maintains internal state for CPU calculations
-            with ProcessMonitor._cpu_lock:
-                cpu_percent = process.cpu_percent(interval=0)
+            # Read everything from one /proc sample
+            with process.oneshot():
+                # Get CPU usage (percentage) - use interval=0 for instant cached reading
+                # This is much faster than interval=0.1 which blocks for 100ms per process
+                # Thread-safe: psutil maintains internal state for CPU calculations
+                with ProcessMonitor._cpu_lock:
+                    cpu_percent = process.cpu_percent(interval=0)
 
-            # Get memory usage (percentage)
-            mem_percent = process.memory_percent()
+                # Get memory usage (percentage)
+                mem_percent = process.memory_percent()
 
             return cpu_percent, mem_percent
 
         except psutil.NoSuchProcess:
+            ProcessMonitor._processes.pop(pid, None)
             return 0.0, 0.0
         except psutil.AccessDenied:
             # Can't access process info, but it exists
             return -1.0, -1.0
         except Exception as e:
-            logger.debug(f"Error getting resources for PID {pid}: {e}")
+            logger.debug("Error getting resources for PID %s: %s", pid, e)
             return 0.0, 0.0
 
     @staticmethod
     def get_system_info() -> dict:
         """Get system resource information (thread-safe)."""
+        now = time.monotonic()
+        cached = ProcessMonitor._system_info
+        if cached is not None and now - ProcessMonitor._system_info_ts < constants.SYSTEM_INFO_TTL:
+            return dict(cached)
+
         try:
-            cpu_count = psutil.cpu_count()
+            cpu_count = ProcessMonitor._cpu_count
+            if cpu_count is None:
+                cpu_count = ProcessMonitor._cpu_count = psutil.cpu_count()
             # Use interval=0 for instant cached reading instead of blocking
             # Thread-safe: psutil maintains internal state for CPU calculations
             with ProcessMonitor._cpu_lock:
@@ -153,7 +185,7 @@ class ProcessMonitor:
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
 
-            return {
+            info = {
                 'cpu_count': cpu_count,
                 'cpu_percent': cpu_percent,
                 'memory_total_gb': memory.total / (1024 ** 3),
@@ -163,6 +195,9 @@ class ProcessMonitor:
                 'disk_used_gb': disk.used / (1024 ** 3),
                 'disk_percent': disk.percent,
             }
+            ProcessMonitor._system_info = info
+            ProcessMonitor._system_info_ts = now
+            return dict(info)
         except Exception as e:
             logger.error(f"Error getting system info: {e}")
             return {}
@@ -602,4 +602,7 @@ class AFLMonitorApp(App):
 def run_interactive_tui(sync_dir: Path, refresh_interval: int = 1):
     """Run the interactive TUI."""
     app = AFLMonitorApp(sync_dir, refresh_interval)
-    app.run()
+    try:
+        app.run()
+    finally:
+        app.monitor.close()
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import os
 import re
+import sys
 import time
 from datetime import datetime
 from typing import Union
 
+from .models import FuzzerStatus
+
 # Compiled regex for stripping ANSI codes (performance optimization)
 _ANSI_ESCAPE_PATTERN = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
@@ -19,27 +23,23 @@ def format_duration(seconds: int) -> str:
         seconds: Duration in seconds
 
     Returns:
-        Formatted string like "2d3h15m" or "1h42m30s"
+        Formatted string like "2d3h" or "1h42m"
     """
     if seconds <= 0:
         return "0s"
 
-    days = seconds // 86400
-    hours = (seconds % 86400) // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-
-    parts = []
-    if days > 0:
-        parts.append(f"{days}d")
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0 and days == 0:  # Don't show minutes if showing days
-        parts.append(f"{minutes}m")
-    if secs > 0 and days == 0 and hours == 0:  # Only show seconds for short durations
-        parts.append(f"{secs}s")
+    days, rem = divmod(seconds, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, secs = divmod(rem, 60)
 
-    return "".join(parts[:3]) if parts else "0s"  # Show at most 3 units
+    # Minutes are hidden once days are shown, seconds once hours are shown
+    if days:
+        return f"{days}d{hours}h" if hours else f"{days}d"
+    if hours:
+        return f"{hours}h{minutes}m" if minutes else f"{hours}h"
+    if minutes:
+        return f"{minutes}m{secs}s" if secs else f"{minutes}m"
+    return f"{secs}s"
 
 
 def format_time_ago(timestamp: int) -> str:
@@ -77,6 +77,9 @@ def format_number(num: Union[int, float], decimals: int = 0) -> str:
     """
     if decimals > 0:
         return f"{num:,.{decimals}f}"
+    # Stats counters are already ints; skip the int() round-trip for them
+    if num.__class__ is int:
+        return f"{num:,}"
     return f"{int(num):,}"
 
 
@@ -257,57 +260,108 @@ def generate_mini_graph(values: list, width: int = 40, label: str = "") -> list:
     return [info]
 
 
+# ANSI color codes
+_BLACK = '\033[30m'
+_RED = '\033[91m'
+_GREEN = '\033[92m'
+_YELLOW = '\033[93m'
+_BLUE = '\033[94m'
+_MAGENTA = '\033[95m'
+_CYAN = '\033[96m'
+_WHITE = '\033[97m'
+
+# ANSI styles
+_BOLD = '\033[1m'
+_DIM = '\033[2m'
+_UNDERLINE = '\033[4m'
+_RESET = '\033[0m'
+
+# Status -> color lookup tables (index 3 is the fallback for unknown statuses)
+_STATUS_IDX = {
+    FuzzerStatus.ALIVE.value: 0,
+    FuzzerStatus.DEAD.value: 1,
+    FuzzerStatus.STARTING.value: 2,
+}
+_STATUS_COLORS = (_GREEN, _RED, _YELLOW, _WHITE)
+
+
+# The color helpers below bind their constants as keyword-only defaults so
+# they are read as fast locals instead of global + class attribute lookups.
+
+def _strip_colors(text: str, *, _sub=_ANSI_ESCAPE_PATTERN.sub) -> str:
+    """Remove ANSI color codes from text."""
+    return _sub('', text)
+
+
+def _colorize(text: str, color: str, bold: bool = False, *, _B=_BOLD, _R=_RESET) -> str:
+    """Add color to text."""
+    return (_B if bold else '') + color + text + _R
+
+
+def _status_color(status: str, *, _idx=_STATUS_IDX.get, _colors=_STATUS_COLORS) -> str:
+    """Get color for status."""
+    return _colors[_idx(status, 3)]
+
+
+def _value_color(
+    value: float, thresholds: dict, *, _RED=_RED, _YELLOW=_YELLOW, _GREEN=_GREEN, _WHITE=_WHITE
+) -> str:
+    """Get color based on threshold."""
+    if 'critical' in thresholds and value >= thresholds['critical']:
+        return _RED
+    elif 'warning' in thresholds and value >= thresholds['warning']:
+        return _YELLOW
+    elif 'good' in thresholds and value >= thresholds['good']:
+        return _GREEN
+    else:
+        return _WHITE
+
+
+def _colorize_plain(text: str, color: str, bold: bool = False) -> str:
+    """Return text unchanged (no-color output)."""
+    return text
+
+
+def _status_color_plain(status: str) -> str:
+    """Return no color code (no-color output)."""
+    return ""
+
+
+def _value_color_plain(value: float, thresholds: dict) -> str:
+    """Return no color code (no-color output)."""
+    return ""
+
+
+# Output is specialized once at import: when stdout is not a terminal (or
+# NO_COLOR is set) coloring becomes a pass-through, so redirected output
+# never carries escape sequences that would need stripping later.
+_USE_COLOR = (
+    sys.stdout is not None
+    and sys.stdout.isatty()
+    and os.environ.get("NO_COLOR") is None
+)
+
+
 class ColorFormatter:
     """ANSI color codes for terminal output."""
 
     # Colors
-    BLACK = '\033[30m'
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
+    BLACK = _BLACK
+    RED = _RED
+    GREEN = _GREEN
+    YELLOW = _YELLOW
+    BLUE = _BLUE
+    MAGENTA = _MAGENTA
+    CYAN = _CYAN
+    WHITE = _WHITE
 
     # Styles
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-    UNDERLINE = '\033[4m'
-    RESET = '\033[0m'
-
-    @staticmethod
-    def strip_colors(text: str) -> str:
-        """Remove ANSI color codes from text."""
-        return _ANSI_ESCAPE_PATTERN.sub('', text)
-
-    @staticmethod
-    def colorize(text: str, color: str, bold: bool = False) -> str:
-        """Add color to text."""
-        prefix = ColorFormatter.BOLD if bold else ''
-        return f"{prefix}{color}{text}{ColorFormatter.RESET}"
-
-    @staticmethod
-    def status_color(status: str) -> str:
-        """Get color for status."""
-        from .models import FuzzerStatus
-        if status == FuzzerStatus.ALIVE.value:
-            return ColorFormatter.GREEN
-        elif status == FuzzerStatus.DEAD.value:
-            return ColorFormatter.RED
-        elif status == FuzzerStatus.STARTING.value:
-            return ColorFormatter.YELLOW
-        else:
-            return ColorFormatter.WHITE
-
-    @staticmethod
-    def value_color(value: float, thresholds: dict) -> str:
-        """Get color based on threshold."""
-        if 'critical' in thresholds and value >= thresholds['critical']:
-            return ColorFormatter.RED
-        elif 'warning' in thresholds and value >= thresholds['warning']:
-            return ColorFormatter.YELLOW
-        elif 'good' in thresholds and value >= thresholds['good']:
-            return ColorFormatter.GREEN
-        else:
-            return ColorFormatter.WHITE
+    BOLD = _BOLD
+    DIM = _DIM
+    UNDERLINE = _UNDERLINE
+    RESET = _RESET
+
+    strip_colors = staticmethod(_strip_colors)
+    colorize = staticmethod(_colorize if _USE_COLOR else _colorize_plain)
+    status_color = staticmethod(_status_color if _USE_COLOR else _status_color_plain)
+    value_color = staticmethod(_value_color if _USE_COLOR else _value_color_plain)
@@ -1,15 +1,32 @@
 """Web server for AFL Overseer dashboard."""
 
 import asyncio
+import contextlib
+import functools
+import gzip
+import hashlib
+import html
 import logging
-import threading
+import multiprocessing
+import operator
+import re
+import signal
+import time
 from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
 
-from aiohttp import web
+import orjson
+from aiohttp import WSCloseCode, WSMsgType, web
 
-from .models import MonitorConfig
+from .models import FuzzerStats, FuzzerStatus, MonitorConfig
 from .monitor import AFLMonitor
 from .process import ProcessMonitor
+from . import constants
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup, POSIX only
+    uvloop = None
 
 
 # Embedded HTML dashboard template
@@ -493,7 +510,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         }
     </style>
 </head>
-<body>
+<body data-refresh-interval="{{ refresh_interval }}">
     <div class="header">
         <div class="header-top">
             <h1>AFL Overseer Dashboard</h1>
@@ -683,7 +700,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
     </div>
 
     <script>
-        let refreshInterval = REFRESH_INTERVAL;
+        let refreshInterval = Number(document.body.dataset.refreshInterval);
         let speedData = [];
         let coverageData = [];
         let pathsData = [];
@@ -693,6 +710,19 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         let maxDataPoints = 60;
         let timePeriod = 'all'; // Default to showing all data
 
+        // Elements rewritten on every update, looked up once
+        const el = {};
+        for (const id of [
+            'alerts', 'aliveFuzzersCard', 'aliveFuzzers', 'fuzzerStatus', 'totalRuntime',
+            'totalSpeed', 'avgSpeedPerCore', 'totalExecs', 'coverage', 'coverageBar',
+            'crashes', 'hangs', 'newFindings', 'corpusAll', 'pendingAll', 'pendingFavs',
+            'lastFind', 'avgCycle', 'maxCycle', 'stability', 'stabilityRange', 'cpuBar',
+            'cpuText', 'ramBar', 'ramText', 'diskBar', 'diskText', 'fuzzersTable',
+            'lastUpdate'
+        ]) {
+            el[id] = document.getElementById(id);
+        }
+
         // Refresh interval management
         let refreshIntervalId = null;
 
@@ -703,30 +733,28 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             updateChartsWithFilter();
         }
 
-        function filterDataByTime(dataArray, timestampArray) {
+        // Index of the first sample inside the selected time period
+        // (samples are appended in time order, so timestamps are ascending)
+        function periodStartIndex() {
             if (timePeriod === 'all') {
-                return dataArray;
+                return 0;
             }
 
-            const period = parseInt(timePeriod);
-            const now = Date.now() / 1000;
-            const cutoff = now - period;
-
-            const filtered = [];
-            for (let i = 0; i < timestampArray.length; i++) {
-                if (timestampArray[i] >= cutoff) {
-                    filtered.push(dataArray[i]);
-                }
+            const cutoff = Date.now() / 1000 - parseInt(timePeriod);
+            let start = 0;
+            while (start < timestamps.length && timestamps[start] < cutoff) {
+                start++;
             }
-            return filtered;
+            return start;
         }
 
         function updateChartsWithFilter() {
-            const filteredSpeed = filterDataByTime(speedData, timestamps);
-            const filteredCoverage = filterDataByTime(coverageData, timestamps);
-            const filteredPaths = filterDataByTime(pathsData, timestamps);
-            const filteredCrashes = filterDataByTime(crashesData, timestamps);
-            const filteredPending = filterDataByTime(pendingData, timestamps);
+            const start = periodStartIndex();
+            const filteredSpeed = speedData.slice(start);
+            const filteredCoverage = coverageData.slice(start);
+            const filteredPaths = pathsData.slice(start);
+            const filteredCrashes = crashesData.slice(start);
+            const filteredPending = pendingData.slice(start);
 
             // Update chart data
             speedChart.data.datasets[0].data = filteredSpeed;
@@ -752,11 +780,13 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             refreshInterval = parseInt(select.value);
             localStorage.setItem('refreshInterval', refreshInterval);
 
-            // Clear and restart interval
-            if (refreshIntervalId) {
-                clearInterval(refreshIntervalId);
+            // Tell the socket, or restart polling if it is down
+            if (socket && socket.readyState === WebSocket.OPEN) {
+                socket.send(JSON.stringify({ interval: refreshInterval }));
+            } else {
+                stopPolling();
+                startPolling();
             }
-            refreshIntervalId = setInterval(fetchData, refreshInterval * 1000);
         }
 
         // Theme management
@@ -968,7 +998,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         }
 
         function updateAlerts(data) {
-            const alertsDiv = document.getElementById('alerts');
+            const alertsDiv = el.alerts;
             const alerts = [];
 
             const summary = data.summary;
@@ -983,26 +1013,9 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 });
             }
 
-            // Low stability alert
-            data.fuzzers.forEach(f => {
-                if (f.status === 'ALIVE' && f.stability < 80) {
-                    alerts.push({
-                        type: 'warning',
-                        icon: '!',
-                        message: `${f.name}: Low stability (${f.stability.toFixed(1)}%)`
-                    });
-                }
-            });
-
-            // High timeout alert
-            data.fuzzers.forEach(f => {
-                if (f.status === 'ALIVE' && f.slowest_exec_ms > 100) {
-                    alerts.push({
-                        type: 'warning',
-                        icon: '!',
-                        message: `${f.name}: High execution timeout (${f.slowest_exec_ms}ms)`
-                    });
-                }
+            // Low stability and high timeout alerts (built by the server)
+            data.fuzzer_alerts.forEach(message => {
+                alerts.push({ type: 'warning', icon: '!', message });
             });
 
             // Render alerts
@@ -1028,7 +1041,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             // Fuzzer status with warnings
             const deadCount = summary.dead_fuzzers || 0;
             const startingCount = summary.starting_fuzzers || 0;
-            const aliveFuzzersCard = document.getElementById('aliveFuzzersCard');
+            const aliveFuzzersCard = el.aliveFuzzersCard;
 
             if (deadCount > 0) {
                 aliveFuzzersCard.classList.add('danger');
@@ -1036,94 +1049,91 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 aliveFuzzersCard.classList.remove('danger');
             }
 
-            document.getElementById('aliveFuzzers').textContent = summary.alive_fuzzers;
+            el.aliveFuzzers.textContent = summary.alive_fuzzers;
             let statusText = `${summary.total_fuzzers} total`;
             if (deadCount > 0) statusText += `, ${deadCount} dead`;
             if (startingCount > 0) statusText += `, ${startingCount} starting`;
-            document.getElementById('fuzzerStatus').textContent = statusText;
+            el.fuzzerStatus.textContent = statusText;
 
             // Runtime
-            document.getElementById('totalRuntime').textContent = formatTime(summary.total_runtime || 0);
+            el.totalRuntime.textContent = formatTime(summary.total_runtime || 0);
 
             // Execution speed
-            document.getElementById('totalSpeed').textContent = formatNumber(summary.total_speed.toFixed(0)) + '/s';
-            document.getElementById('avgSpeedPerCore').textContent = (summary.avg_speed_per_core || 0).toFixed(0) + '/s';
+            el.totalSpeed.textContent = formatNumber(summary.total_speed.toFixed(0)) + '/s';
+            el.avgSpeedPerCore.textContent = (summary.avg_speed_per_core || 0).toFixed(0) + '/s';
 
             // Total executions
-            document.getElementById('totalExecs').textContent = formatNumber(summary.total_execs);
+            el.totalExecs.textContent = formatNumber(summary.total_execs);
 
             // Coverage
-            document.getElementById('coverage').textContent = summary.max_coverage.toFixed(1) + '%';
-            document.getElementById('coverageBar').style.width = Math.min(summary.max_coverage, 100) + '%';
+            el.coverage.textContent = summary.max_coverage.toFixed(1) + '%';
+            el.coverageBar.style.width = Math.min(summary.max_coverage, 100) + '%';
 
             // Crashes & Hangs with new findings
-            document.getElementById('crashes').textContent = summary.total_crashes;
-            document.getElementById('hangs').textContent = summary.total_hangs;
+            el.crashes.textContent = summary.total_crashes;
+            el.hangs.textContent = summary.total_hangs;
             let newFindingsText = '';
             if (summary.new_crashes > 0) newFindingsText += `(+${summary.new_crashes}!)`;
             if (summary.new_hangs > 0) newFindingsText += ` (+${summary.new_hangs} hangs!)`;
-            document.getElementById('newFindings').innerHTML = newFindingsText ?
+            el.newFindings.innerHTML = newFindingsText ?
                 `<span style="color: var(--danger); font-weight: 600;">${newFindingsText}</span>` : '';
 
             // Corpus
-            document.getElementById('corpusAll').textContent = formatNumber(summary.total_corpus);
+            el.corpusAll.textContent = formatNumber(summary.total_corpus);
 
             // Pending paths
-            document.getElementById('pendingAll').textContent = formatNumber(summary.total_pending);
-            document.getElementById('pendingFavs').textContent = summary.total_pending_favs;
+            el.pendingAll.textContent = formatNumber(summary.total_pending);
+            el.pendingFavs.textContent = summary.total_pending_favs;
 
             // Last find
             const lastFindText = formatTimeAgo(summary.last_find_time);
-            document.getElementById('lastFind').textContent = lastFindText === 'never' ? 'never' : lastFindText;
+            el.lastFind.textContent = lastFindText === 'never' ? 'never' : lastFindText;
 
             // Cycles
-            document.getElementById('avgCycle').textContent = summary.avg_cycle.toFixed(1);
-            document.getElementById('maxCycle').textContent = summary.max_cycle;
+            el.avgCycle.textContent = summary.avg_cycle.toFixed(1);
+            el.maxCycle.textContent = summary.max_cycle;
 
             // Stability
-            document.getElementById('stability').textContent = summary.avg_stability.toFixed(1) + '%';
-            document.getElementById('stabilityRange').textContent =
+            el.stability.textContent = summary.avg_stability.toFixed(1) + '%';
+            el.stabilityRange.textContent =
                 `${summary.min_stability.toFixed(1)}%-${summary.max_stability.toFixed(1)}%`;
 
             // Header system metrics with progress bars
             const cpuPercent = Math.min(system.cpu_percent, 100);
-            document.getElementById('cpuBar').style.width = cpuPercent + '%';
-            document.getElementById('cpuText').textContent = system.cpu_percent.toFixed(1) + '%';
+            el.cpuBar.style.width = cpuPercent + '%';
+            el.cpuText.textContent = system.cpu_percent.toFixed(1) + '%';
 
             const memPercent = Math.min(system.memory_percent || 0, 100);
-            document.getElementById('ramBar').style.width = memPercent + '%';
-            document.getElementById('ramText').textContent =
+            el.ramBar.style.width = memPercent + '%';
+            el.ramText.textContent =
                 `${system.memory_used_gb.toFixed(1)}/${system.memory_total_gb.toFixed(1)} GB`;
 
             const diskPercent = Math.min(system.disk_percent || 0, 100);
-            document.getElementById('diskBar').style.width = diskPercent + '%';
-            document.getElementById('diskText').textContent =
+            el.diskBar.style.width = diskPercent + '%';
+            el.diskText.textContent =
                 `${(system.disk_used_gb || 0).toFixed(0)}/${(system.disk_total_gb || 0).toFixed(0)} GB`;
 
-            // Fuzzers table
-            const tbody = document.getElementById('fuzzersTable');
-            tbody.innerHTML = data.fuzzers.map(f => {
-                const rowClass = f.status === 'DEAD' ? 'dead' : (f.stability < 80 ? 'warning' : '');
-                const warnings = [];
-                if (f.stability < 80) warnings.push(`!${f.stability.toFixed(1)}%`);
-                if (f.slowest_exec_ms > 100) warnings.push(`slow:${f.slowest_exec_ms}ms`);
-
-                return `
-                <tr class="${rowClass}">
-                    <td>${f.name}${warnings.length > 0 ? `<span class="warning-badge">${warnings.join(' ')}</span>` : ''}</td>
-                    <td><span class="status ${f.status.toLowerCase()}">${f.status}</span></td>
-                    <td>${formatTime(f.run_time)}</td>
-                    <td>${formatNumber(f.execs_done)}</td>
-                    <td>${f.exec_speed.toFixed(0)}/s</td>
-                    <td>${f.bitmap_cvg.toFixed(1)}%</td>
-                    <td>${f.saved_crashes}</td>
-                    <td>${f.corpus_count}</td>
-                    <td>${f.stability ? f.stability.toFixed(1) + '%' : 'N/A'}</td>
-                </tr>
-            `}).join('');
-
-            // Update charts with timestamp tracking
-            const timestamp = new Date().toLocaleTimeString();
+            // Fuzzers table: only rows whose server-rendered HTML changed are re-parsed
+            const rows = data.fuzzer_rows;
+            if (!renderedRows || rows.length !== renderedRows.length) {
+                el.fuzzersTable.innerHTML = rows.join('');
+            } else {
+                for (let i = 0; i < rows.length; i++) {
+                    if (rows[i] !== renderedRows[i]) el.fuzzersTable.rows[i].outerHTML = rows[i];
+                }
+            }
+            renderedRows = rows.slice();
+
+            // Apply time period filter and update charts
+            updateChartsWithFilter();
+
+            // Update last update time
+            el.lastUpdate.textContent =
+                'Last update: ' + statsReceivedAt.toLocaleTimeString();
+        }
+
+        // Record chart history for every snapshot, even while rendering is deferred
+        function recordHistory(summary) {
             const unixTime = Math.floor(Date.now() / 1000);
 
             if (speedData.length >= maxDataPoints) {
@@ -1141,24 +1151,104 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             crashesData.push(summary.total_crashes);
             pendingData.push(summary.total_pending);
             timestamps.push(unixTime);
+        }
 
-            // Apply time period filter and update charts
-            updateChartsWithFilter();
+        // Render at most once per animation frame. Browsers pause animation frames
+        // in hidden tabs, so those skip DOM and chart work until shown again.
+        let renderedRows = null;
+        let renderPending = false;
 
-            // Update last update time
-            document.getElementById('lastUpdate').textContent = 'Last update: ' + timestamp;
+        function scheduleRender() {
+            if (renderPending) return;
+            renderPending = true;
+            requestAnimationFrame(() => {
+                renderPending = false;
+                updateDashboard(statsState);
+            });
+        }
+
+        // Latest full snapshot; /api/stats/delta only sends what changed since statsEtag
+        let statsState = null;
+        let statsEtag = null;
+        let statsReceivedAt = null;
+
+        // Merge a full snapshot or a delta (which carries 'base') into statsState
+        function applyStats(data) {
+            if (data.base !== undefined && statsState && statsState.version === data.base) {
+                Object.assign(statsState.summary, data.summary);
+                Object.assign(statsState.system, data.system);
+                if (data.fuzzer_rows) {
+                    statsState.fuzzer_rows = data.fuzzer_rows;
+                } else if (data.fuzzer_rows_changed) {
+                    data.fuzzer_rows_changed.forEach(([i, row]) => { statsState.fuzzer_rows[i] = row; });
+                }
+                if (data.fuzzer_alerts) statsState.fuzzer_alerts = data.fuzzer_alerts;
+                statsState.version = data.version;
+            } else if (data.base === undefined) {
+                // A full snapshot we already hold (e.g. a poll racing the socket) is not a new point
+                if (statsState && statsState.version === data.version) return;
+                statsState = data;
+            } else {
+                return;
+            }
+            statsEtag = `W/"${statsState.version}"`;
+            statsReceivedAt = new Date();
+            recordHistory(statsState.summary);
+            scheduleRender();
         }
 
         async function fetchData() {
             try {
-                const response = await fetch('/api/stats');
-                const data = await response.json();
-                updateDashboard(data);
+                const headers = statsEtag ? { 'If-None-Match': statsEtag } : {};
+                const response = await fetch('/api/stats/delta', { headers });
+                if (response.status === 304) return;
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                applyStats(await response.json());
             } catch (error) {
                 console.error('Error fetching data:', error);
             }
         }
 
+        // Snapshots are pushed over /ws; poll /api/stats/delta only while it is down
+        let socket = null;
+        const textDecoder = new TextDecoder();
+
+        function startPolling() {
+            if (!refreshIntervalId) {
+                fetchData();
+                refreshIntervalId = setInterval(fetchData, refreshInterval * 1000);
+            }
+        }
+
+        function stopPolling() {
+            if (refreshIntervalId) {
+                clearInterval(refreshIntervalId);
+                refreshIntervalId = null;
+            }
+        }
+
+        function connectSocket() {
+            if (!window.WebSocket) {
+                startPolling();
+                return;
+            }
+            const scheme = location.protocol === 'https:' ? 'wss' : 'ws';
+            socket = new WebSocket(`${scheme}://${location.host}/ws`);
+            socket.binaryType = 'arraybuffer';
+            socket.onopen = () => {
+                stopPolling();
+                socket.send(JSON.stringify({ interval: refreshInterval }));
+            };
+            socket.onmessage = (event) => {
+                applyStats(JSON.parse(textDecoder.decode(event.data)));
+            };
+            socket.onclose = () => {
+                socket = null;
+                startPolling();
+                setTimeout(connectSocket, Math.max(refreshInterval, 5) * 1000);
+            };
+        }
+
         // Load saved preferences
         const savedInterval = localStorage.getItem('refreshInterval');
         if (savedInterval) {
@@ -1175,24 +1265,318 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             document.getElementById('timePeriodSelect').value = timePeriod;
         }
 
-        // Initial fetch
-        fetchData();
-
-        // Auto-refresh
-        refreshIntervalId = setInterval(fetchData, refreshInterval * 1000);
+        // Live updates; connectSocket falls back to polling if the socket is unavailable
+        connectSocket();
     </script>
 </body>
 </html>
 """
 
 
+def _minify_template(template: str) -> str:
+    """
+    Strip indentation, blank lines and whole-line comments from the dashboard.
+
+    Line breaks are kept, so JS statements never merge and automatic semicolon
+    insertion behaves exactly as in the source. HTML_TEMPLATE stays readable;
+    only what is served is shrunk.
+    """
+    kept = []
+    for line in template.splitlines():
+        line = line.strip()
+        if not line or line.startswith('//'):
+            continue
+        if line.startswith('<!--') and line.endswith('-->'):
+            continue
+        kept.append(line)
+    return '\n'.join(kept)
+
+
+# Served form of HTML_TEMPLATE (~40 KB -> ~26 KB before compression)
+_HTML_TEMPLATE_MIN = _minify_template(HTML_TEMPLATE)
+
+
+# Inline <style>/<script> blocks (not <script src=...>) of the minified page
+_INLINE_ASSET_PATTERN = re.compile(r'<(style|script)>\n(.*?)\n</\1>', re.DOTALL)
+
+# Tag -> (file extension, content type, replacement tag)
+_ASSET_TYPES = {
+    'style': ('css', 'text/css', '<link rel="stylesheet" href="/static/{}">'),
+    'script': ('js', 'application/javascript', '<script src="/static/{}"></script>'),
+}
+
+
+def _split_assets(page: str) -> Tuple[str, Dict[str, Tuple[bytes, bytes, str]]]:
+    """
+    Move a page's inline CSS and JS into content-addressed static assets.
+
+    Asset names embed a hash of their content, so they can be cached forever
+    and the HTML shell that links them stays small.
+
+    Returns:
+        Tuple of (html_shell, {asset_name: (body, gzip_body, content_type)})
+    """
+    assets = {}
+
+    def _extract(match):
+        ext, content_type, tag = _ASSET_TYPES[match.group(1)]
+        body = match.group(2).encode('utf-8')
+        name = f"app.{hashlib.sha256(body).hexdigest()[:16]}.{ext}"
+        assets[name] = (body, gzip.compress(body, 6), content_type)
+        return tag.format(name)
+
+    return _INLINE_ASSET_PATTERN.sub(_extract, page), assets
+
+
+# Dashboard HTML shell (~6 KB, ~1.7 KB gzipped) plus the stylesheet and script it links
+_HTML_SHELL, _STATIC_ASSETS = _split_assets(_HTML_TEMPLATE_MIN)
+
+
+# Matches "{{ name }}" placeholders in HTML_TEMPLATE
+_TEMPLATE_VAR_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+def _render_template(template: str, **context) -> str:
+    """
+    Substitute all {{ name }} placeholders in a template in a single pass.
+
+    Args:
+        template: Template text
+        **context: Placeholder values (converted with str())
+
+    Returns:
+        Rendered text
+
+    Raises:
+        KeyError: If the template references a name missing from context
+    """
+    return _TEMPLATE_VAR_PATTERN.sub(lambda m: str(context[m.group(1)]), template)
+
+
+def _fuzzer_row(stats: FuzzerStats) -> dict:
+    """Build the /api/stats entry for one fuzzer."""
+    # status is always a FuzzerStatus: AFLMonitor assigns it from
+    # ProcessMonitor.check_process_status() for every collected fuzzer
+    return {
+        'name': stats.fuzzer_name,
+        'status': stats.status.value,
+        'run_time': stats.run_time,
+        'execs_done': stats.execs_done,
+        'exec_speed': stats.execs_per_sec,
+        'bitmap_cvg': stats.bitmap_cvg,
+        'saved_crashes': stats.saved_crashes,
+        'saved_hangs': stats.saved_hangs,
+        'corpus_count': stats.corpus_count,
+        'stability': stats.stability,
+        'cpu_percent': stats.cpu_usage,
+        'memory_percent': stats.memory_usage,
+        'slowest_exec_ms': stats.slowest_exec_ms,
+        'exec_timeout': stats.exec_timeout,
+    }
+
+
+def _rounded(section: dict) -> dict:
+    """
+    Round the float values of a payload section to WEB_FLOAT_DIGITS places.
+
+    The dashboard shows at most one decimal, so the extra digits only cost
+    bytes and make otherwise identical snapshots look changed.
+    """
+    digits = constants.WEB_FLOAT_DIGITS
+    return {
+        key: round(value, digits) if value.__class__ is float else value
+        for key, value in section.items()
+    }
+
+
+# Fuzzers table row, filled in server-side so the client assigns the whole
+# table with a single innerHTML write instead of templating each row in JS.
+# Filled positionally with a tuple ('%' on a tuple is cheaper than
+# str.format with keyword arguments):
+# (row class, name, badge, status, status, run time, execs, speed,
+#  coverage, crashes, corpus, stability)
+_ROW_TEMPLATE = (
+    '<tr class="%s">'
+    '<td>%s%s</td>'
+    '<td><span class="status %s">%s</span></td>'
+    '<td>%s</td>'
+    '<td>%s</td>'
+    '<td>%.0f/s</td>'
+    '<td>%.1f%%</td>'
+    '<td>%d</td>'
+    '<td>%d</td>'
+    '<td>%s</td>'
+    '</tr>'
+)
+
+
+def _short_number(num) -> str:
+    """Abbreviate a count the way the dashboard does (1.50K, 2.00M, ...)."""
+    if num >= 1_000_000_000:
+        return f"{num / 1_000_000_000:.2f}B"
+    if num >= 1_000_000:
+        return f"{num / 1_000_000:.2f}M"
+    if num >= 1_000:
+        return f"{num / 1_000:.2f}K"
+    return str(num)
+
+
+def _short_duration(seconds: int) -> str:
+    """Format a run time the way the dashboard does (1h 5m, 4m 10s, 5s)."""
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    if minutes > 0:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+
+# Row fields that _row_html depends on, in its argument order
+_ROW_FIELDS = operator.itemgetter(
+    'name', 'status', 'run_time', 'execs_done', 'exec_speed', 'bitmap_cvg',
+    'saved_crashes', 'corpus_count', 'stability', 'slowest_exec_ms',
+)
+
+
+@functools.lru_cache(maxsize=constants.WEB_ROW_CACHE_SIZE)
+def _row_html(name, status, run_time, execs_done, exec_speed, bitmap_cvg,
+              saved_crashes, corpus_count, stability, slowest_exec_ms) -> str:
+    """
+    Render one fuzzers table row.
+
+    Cached on the displayed values: fuzzers whose stats file has not changed
+    (and every dead fuzzer) reuse their row from the previous snapshot.
+    """
+    warnings = []
+    if stability < 80:
+        warnings.append(f"!{stability:.1f}%")
+    if slowest_exec_ms > 100:
+        warnings.append(f"slow:{slowest_exec_ms}ms")
+
+    return _ROW_TEMPLATE % (
+        'dead' if status == FuzzerStatus.DEAD.value else ('warning' if stability < 80 else ''),
+        html.escape(name),
+        f'<span class="warning-badge">{" ".join(warnings)}</span>' if warnings else '',
+        status,
+        status,
+        _short_duration(run_time),
+        _short_number(execs_done),
+        exec_speed,
+        bitmap_cvg,
+        saved_crashes,
+        corpus_count,
+        f"{stability:.1f}%" if stability else 'N/A',
+    )
+
+
+def _fuzzer_rows_html(rows: list) -> list:
+    """Render the fuzzers table rows from _fuzzer_row dicts."""
+    return [_row_html(*_ROW_FIELDS(row)) for row in rows]
+
+
+def _fuzzer_alerts(rows: list) -> list:
+    """Dashboard warnings for alive fuzzers (low stability, then slow execs) as HTML-safe text."""
+    alive = [row for row in rows if row['status'] == FuzzerStatus.ALIVE.value]
+    return (
+        [f"{html.escape(row['name'])}: Low stability ({row['stability']:.1f}%)"
+         for row in alive if row['stability'] < 80]
+        + [f"{html.escape(row['name'])}: High execution timeout ({row['slowest_exec_ms']}ms)"
+           for row in alive if row['slowest_exec_ms'] > 100]
+    )
+
+
+def _changed_fields(previous: dict, current: dict) -> dict:
+    """Return the entries of current whose values differ from previous."""
+    return {key: value for key, value in current.items() if previous.get(key) != value}
+
+
+class _DashboardAccessLogger(web.AccessLogger):
+    """Access logger that leaves out the dashboard's periodic /api/stats polls."""
+
+    def log(self, request, response, time):
+        if request.path.startswith('/api/stats'):
+            return
+        super().log(request, response, time)
+
+
+class _WsClient:
+    """A connected dashboard WebSocket and the snapshot version it last received."""
+
+    __slots__ = ('ws', 'interval', 'version', 'pending')
+
+    def __init__(self, ws: web.WebSocketResponse, interval: float):
+        self.ws = ws
+        self.interval = interval
+        self.version = 0
+        # Set when a snapshot newer than `version` is available
+        self.pending = asyncio.Event()
+
+
+def _json_error(message: str, error: Exception, status: int = 500) -> web.Response:
+    """Build a JSON error response, encoded straight to bytes with orjson."""
+    return web.Response(
+        body=orjson.dumps({'error': message, 'detail': str(error)}),
+        status=status,
+        content_type='application/json',
+    )
+
+
+def _stats_etag(version: int) -> str:
+    """
+    Weak ETag for a stats snapshot version.
+
+    Weak, because the gzip and identity bodies of one snapshot share it and
+    are only semantically, not byte-for-byte, equal.
+    """
+    return f'W/"{version}"'
+
+
+def _if_none_match_version(request: web.Request) -> Optional[int]:
+    """Return the snapshot version named in If-None-Match (weak or strong form), if any."""
+    value = request.headers.get('If-None-Match', '')
+    if value.startswith('W/'):
+        value = value[2:]
+    try:
+        return int(value.strip('"'))
+    except ValueError:
+        return None
+
+
+def _accepts_gzip(request: web.Request) -> bool:
+    """Check whether the client accepts gzip-encoded responses."""
+    return 'gzip' in request.headers.get('Accept-Encoding', '')
+
+
 class WebServer:
     """Web server for AFL Overseer dashboard with thread-safe request handling."""
 
+    __slots__ = (
+        'findings_dir', 'refresh_interval', 'app', 'config', 'monitor',
+        '_index_bytes', '_index_etag', '_index_gzip', '_index_gzip_etag',
+        '_stats_lock', '_stats_ttl', '_cached_stats_body', '_cached_stats_ts',
+        '_stats_version', '_stats_sections', '_cached_delta_body',
+        '_cached_dashboard_body', '_cached_stats_gzip', '_cached_dashboard_gzip',
+        '_cached_delta_gzip', '_dashboard_view',
+        '_ws_clients', '_broadcast_task',
+        '_state_save_interval', '_state_saved_ts', '_unsaved_summary',
+    )
+
     def __init__(self, findings_dir: Path, refresh_interval: int = 5):
         self.findings_dir = findings_dir
         self.refresh_interval = refresh_interval
         self.app = web.Application()
+
+        # The dashboard page never changes for the life of the server, so render
+        # and encode it once and let browsers revalidate it by ETag
+        self._index_bytes = _render_template(
+            _HTML_SHELL, refresh_interval=refresh_interval
+        ).encode('utf-8')
+        index_digest = hashlib.sha256(self._index_bytes).hexdigest()[:32]
+        self._index_etag = f'"{index_digest}"'
+        # Pre-compressed variant, compressed once instead of per request
+        self._index_gzip = gzip.compress(self._index_bytes, 6)
+        self._index_gzip_etag = f'"{index_digest}-gzip"'
         self.setup_routes()
 
         # Create monitor config
@@ -1212,166 +1596,536 @@ class WebServer:
 
         self.monitor = AFLMonitor(self.config)
 
+        # Campaign state stays resident: load it once here and write it back at
+        # most every _state_save_interval seconds (and once more on cleanup)
+        try:
+            self.monitor.load_previous_state()
+        except Exception:
+            pass  # State loading is non-critical
+        self._state_save_interval = max(refresh_interval, constants.WEB_STATE_SAVE_INTERVAL)
+        self._state_saved_ts = 0.0
+        self._unsaved_summary = None
+
         # Async lock for thread-safe request handling (prevents concurrent stats collection)
         self._stats_lock = asyncio.Lock()
 
+        # Last serialized /api/stats body; requests arriving within the TTL reuse it
+        # instead of rescanning the findings directory
+        self._stats_ttl = refresh_interval / 2
+        self._cached_stats_body: Optional[bytes] = None
+        self._cached_stats_ts = 0.0
+
+        # Snapshot version and the (summary, system, fuzzers) sections it was
+        # built from, used to serve /api/stats/delta and skip unchanged snapshots.
+        # Versions double as ETags, so they start from the current time in ms:
+        # an ETag held from before a server restart can never match by accident.
+        self._stats_version = time.time_ns() // 1_000_000
+        self._stats_sections: Optional[Tuple[dict, dict, list]] = None
+        self._cached_delta_body: Optional[bytes] = None
+
+        # Full snapshot for the dashboard page (/ws and /api/stats/delta): the
+        # rendered table rows and alert messages take the place of the fuzzers list
+        self._cached_dashboard_body: Optional[bytes] = None
+        # (rows, alerts) behind that body, diffed against to build the next delta
+        self._dashboard_view: Optional[Tuple[list, list]] = None
+
+        # gzip-compressed copies of the bodies above, made with the snapshot
+        # and shared by every client until the next one
+        self._cached_stats_gzip: Optional[bytes] = None
+        self._cached_dashboard_gzip: Optional[bytes] = None
+        self._cached_delta_gzip: Optional[bytes] = None
+
+        # Connected /ws clients and the task pushing snapshots to them
+        self._ws_clients: Set[_WsClient] = set()
+        self._broadcast_task: Optional[asyncio.Task] = None
+        self.app.on_shutdown.append(self._close_websockets)
+        self.app.on_cleanup.append(self._close_monitor)
+
     def setup_routes(self):
         """Setup web server routes."""
         self.app.router.add_get('/', self.handle_index)
         self.app.router.add_get('/api/stats', self.handle_stats)
+        self.app.router.add_get('/api/stats/delta', self.handle_stats_delta)
+        self.app.router.add_get('/ws', self.handle_ws)
+        self.app.router.add_get('/static/{name}', self.handle_static)
 
     async def handle_index(self, request):
         """Serve the main dashboard HTML."""
-        html = HTML_TEMPLATE.replace('REFRESH_INTERVAL', str(self.refresh_interval))
-        return web.Response(text=html, content_type='text/html')
+        gzip_ok = _accepts_gzip(request)
+        etag = self._index_gzip_etag if gzip_ok else self._index_etag
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers=headers)
+        if gzip_ok:
+            headers['Content-Encoding'] = 'gzip'
+            body = self._index_gzip
+        else:
+            body = self._index_bytes
+        return web.Response(body=body, content_type='text/html', charset='utf-8', headers=headers)
+
+    async def handle_static(self, request):
+        """
+        Serve a dashboard stylesheet or script.
 
-    async def handle_stats(self, request):
+        Asset URLs change whenever their content does, so browsers may cache
+        them indefinitely and only the small HTML shell is ever revalidated.
         """
-        API endpoint for fuzzer statistics with thread-safe handling.
-        Uses async lock to prevent concurrent request interference.
+        asset = _STATIC_ASSETS.get(request.match_info['name'])
+        if asset is None:
+            raise web.HTTPNotFound()
+        body, body_gzip, content_type = asset
+        headers = {'Cache-Control': 'public, max-age=31536000, immutable', 'Vary': 'Accept-Encoding'}
+        if _accepts_gzip(request):
+            headers['Content-Encoding'] = 'gzip'
+            body = body_gzip
+        return web.Response(body=body, content_type=content_type, charset='utf-8', headers=headers)
+
+    def _gather_stats(self):
         """
+        Collect stats and system info, then save state if it is due (blocking).
+
+        Only stats collection failures propagate; state and system info
+        problems are non-critical and fall back to defaults.
+
+        Returns:
+            Tuple of (fuzzer_stats_list, campaign_summary, system_info)
+        """
+        all_stats, summary = self.monitor.collect_stats()
+
+        # Get system info with fallback
+        try:
+            system_info = ProcessMonitor.get_system_info()
+        except Exception as e:
+            logging.warning(f"Failed to get system info: {e}")
+            system_info = {
+                'cpu_count': 0, 'cpu_percent': 0,
+                'memory_total_gb': 0, 'memory_used_gb': 0, 'memory_percent': 0
+            }
+
+        self._unsaved_summary = summary
+        if time.monotonic() - self._state_saved_ts >= self._state_save_interval:
+            self._save_state()
+
+        return all_stats, summary, system_info
+
+    def _save_state(self):
+        """Write the latest unsaved campaign summary to the state file (blocking, non-critical)."""
+        summary = self._unsaved_summary
+        if summary is None:
+            return
+        self._unsaved_summary = None
+        self._state_saved_ts = time.monotonic()
+        try:
+            self.monitor.save_current_state(summary)
+        except Exception:
+            pass  # State saving is non-critical
+
+    def _stats_fresh(self) -> bool:
+        """Check whether the cached stats snapshot is younger than the TTL."""
+        return (
+            self._cached_stats_body is not None
+            and time.monotonic() - self._cached_stats_ts < self._stats_ttl
+        )
+
+    def _gzipped(self, body: bytes) -> bytes:
+        """Return the gzip form of a stats body, reusing the snapshot's pre-compressed copies."""
+        if body is self._cached_stats_body:
+            return self._cached_stats_gzip
+        if body is self._cached_dashboard_body:
+            return self._cached_dashboard_gzip
+        if body is self._cached_delta_body:
+            return self._cached_delta_gzip
+        return gzip.compress(body, constants.WEB_GZIP_LEVEL)
+
+    def _stats_response(
+        self, request: web.Request, body: bytes, headers: Optional[dict] = None
+    ) -> web.Response:
+        """Wrap a serialized stats body, gzipped if it is large enough and the client accepts it."""
+        headers = dict(headers) if headers else {}
+        headers['Vary'] = 'Accept-Encoding'
+        if len(body) >= constants.WEB_GZIP_MIN_SIZE and _accepts_gzip(request):
+            headers['Content-Encoding'] = 'gzip'
+            body = self._gzipped(body)
+        return web.Response(body=body, content_type='application/json', headers=headers)
+
+    async def _refresh_stats(self) -> Optional[web.Response]:
+        """
+        Make sure the cached stats snapshot is fresh, collecting if needed.
+        Uses async lock so concurrent requests share a single collection.
+
+        Returns:
+            None on success, or an error response if collection failed
+        """
+        if self._stats_fresh():
+            return None
+
         # Acquire lock to prevent concurrent stats collection
         async with self._stats_lock:
-            try:
-                # Load previous state (non-critical)
-                try:
-                    self.monitor.load_previous_state()
-                except Exception:
-                    pass  # State loading is non-critical
+            # Another request may have refreshed the cache while we waited
+            if self._stats_fresh():
+                return None
 
-                # Collect statistics (runs in thread pool, but protected by async lock)
+            try:
+                # Collect, format and serialize in one executor call so neither the
+                # blocking disk/psutil work nor the JSON/gzip encoding runs on the
+                # event loop thread
                 try:
-                    loop = asyncio.get_event_loop()
-                    all_stats, summary = await loop.run_in_executor(
-                        None, self.monitor.collect_stats
-                    )
+                    loop = asyncio.get_running_loop()
+                    snapshot = await loop.run_in_executor(None, self._build_snapshot)
                 except Exception as e:
                     logging.error(f"Failed to collect stats: {e}")
-                    return web.json_response(
-                        {'error': 'Failed to collect statistics', 'detail': str(e)},
-                        status=500
-                    )
+                    return _json_error('Failed to collect statistics', e)
 
-                # Get system info with fallback (run in executor to avoid blocking)
-                try:
-                    system_info = await loop.run_in_executor(
-                        None, ProcessMonitor.get_system_info
-                    )
-                except Exception as e:
-                    logging.warning(f"Failed to get system info: {e}")
-                    system_info = {
-                        'cpu_count': 0, 'cpu_percent': 0,
-                        'memory_total_gb': 0, 'memory_used_gb': 0, 'memory_percent': 0
-                    }
+                self._store_snapshot(snapshot)
+                return None
+
+            except Exception as e:
+                logging.error(f"Unexpected error in stats endpoint: {e}")
+                return _json_error('Internal server error', e)
+
+    @staticmethod
+    def _snapshot_sections(all_stats, summary, system_info: dict) -> Tuple[dict, dict, list]:
+        """Format collected stats into the (summary, system, fuzzers) API sections."""
+        summary_data = {
+            # Fuzzer counts
+            'total_fuzzers': summary.total_fuzzers,
+            'alive_fuzzers': summary.alive_fuzzers,
+            'dead_fuzzers': summary.dead_fuzzers,
+            'starting_fuzzers': summary.starting_fuzzers,
+
+            # Runtime
+            'total_runtime': summary.total_runtime,
+
+            # Execution stats
+            'total_execs': summary.total_execs,
+            'total_speed': summary.total_speed,
+            'avg_speed_per_core': summary.avg_speed_per_core,
+            'current_avg_speed': summary.current_avg_speed,
+
+            # Coverage
+            'max_coverage': summary.max_coverage,
+
+            # Findings
+            'total_crashes': summary.total_crashes,
+            'total_hangs': summary.total_hangs,
+            'new_crashes': summary.new_crashes,
+            'new_hangs': summary.new_hangs,
+
+            # Corpus stats
+            'total_corpus': summary.total_corpus,
+            'total_pending': summary.total_pending,
+            'total_pending_favs': summary.total_pending_favs,
+
+            # Last activity
+            'last_find_time': summary.last_find_time,
+            'last_crash_time': summary.last_crash_time,
+            'last_hang_time': summary.last_hang_time,
+
+            # Cycles
+            'max_cycle': summary.max_cycle,
+            'avg_cycle': summary.avg_cycle,
+            'cycles_wo_finds': summary.cycles_wo_finds,
+
+            # Stability
+            'avg_stability': summary.avg_stability,
+            'min_stability': summary.min_stability,
+            'max_stability': summary.max_stability,
+
+            # Advanced metrics
+            'total_edges_found': summary.total_edges_found,
+            'max_total_edges': summary.max_total_edges,
+        }
+        system_data = {
+            'cpu_count': system_info.get('cpu_count', 0),
+            'cpu_percent': system_info.get('cpu_percent', 0),
+            'memory_total_gb': system_info.get('memory_total_gb', 0),
+            'memory_used_gb': system_info.get('memory_used_gb', 0),
+            'memory_percent': system_info.get('memory_percent', 0),
+            'disk_total_gb': system_info.get('disk_total_gb', 0),
+            'disk_used_gb': system_info.get('disk_used_gb', 0),
+            'disk_percent': system_info.get('disk_percent', 0),
+        }
+        fuzzers = [_rounded(_fuzzer_row(stats)) for stats in all_stats]
+        return _rounded(summary_data), _rounded(system_data), fuzzers
+
+    def _build_snapshot(self) -> Optional[tuple]:
+        """
+        Collect stats and serialize the next snapshot (blocking, runs in the executor).
+
+        Only reads the current snapshot state; the caller holds _stats_lock,
+        so nothing changes it meanwhile. The version only advances when the
+        data differs from the previous snapshot, so an idle campaign keeps
+        answering 304 and pushes nothing.
+
+        The delta carries the changed summary/system fields, the table rows
+        whose HTML changed as [index, html] pairs (the whole list if the number
+        of fuzzers changed), and the alerts only if they changed.
+
+        Returns:
+            Tuple of (sections, dashboard_view, body, body_gzip, dashboard_body,
+            dashboard_gzip, delta_body, delta_gzip), or None if the data is unchanged
+        """
+        sections = self._snapshot_sections(*self._gather_stats())
+        if sections == self._stats_sections:
+            return None
+        summary_data, system_data, fuzzers = sections
+
+        version = self._stats_version + 1
+        body = orjson.dumps({
+            'version': version,
+            'summary': summary_data,
+            'system': system_data,
+            'fuzzers': fuzzers,
+        })
+
+        # The page only needs the rendered rows and alerts, not the fuzzer data
+        rows = _fuzzer_rows_html(fuzzers)
+        alerts = _fuzzer_alerts(fuzzers)
+        dashboard_body = orjson.dumps({
+            'version': version,
+            'summary': summary_data,
+            'system': system_data,
+            'fuzzer_rows': rows,
+            'fuzzer_alerts': alerts,
+        })
+
+        delta_body = delta_gzip = None
+        if self._stats_sections is not None:
+            prev_summary, prev_system, _ = self._stats_sections
+            prev_rows, prev_alerts = self._dashboard_view
+            delta = {
+                'version': version,
+                'base': version - 1,
+                'summary': _changed_fields(prev_summary, summary_data),
+                'system': _changed_fields(prev_system, system_data),
+            }
+            if len(rows) != len(prev_rows):
+                delta['fuzzer_rows'] = rows
+            else:
+                changed_rows = [
+                    [index, row] for index, (row, prev_row) in enumerate(zip(rows, prev_rows))
+                    if row != prev_row
+                ]
+                if changed_rows:
+                    delta['fuzzer_rows_changed'] = changed_rows
+            if alerts != prev_alerts:
+                delta['fuzzer_alerts'] = alerts
+            delta_body = orjson.dumps(delta)
+            delta_gzip = gzip.compress(delta_body, constants.WEB_GZIP_LEVEL)
+
+        return (sections, (rows, alerts), body, gzip.compress(body, constants.WEB_GZIP_LEVEL),
+                dashboard_body, gzip.compress(dashboard_body, constants.WEB_GZIP_LEVEL),
+                delta_body, delta_gzip)
+
+    def _store_snapshot(self, snapshot: Optional[tuple]):
+        """Publish a snapshot from _build_snapshot (event loop thread, no awaits)."""
+        self._cached_stats_ts = time.monotonic()
+        if snapshot is None:
+            return
+        (self._stats_sections, self._dashboard_view,
+         self._cached_stats_body, self._cached_stats_gzip,
+         self._cached_dashboard_body, self._cached_dashboard_gzip,
+         self._cached_delta_body, self._cached_delta_gzip) = snapshot
+        self._stats_version += 1
+
+    async def handle_stats(self, request):
+        """
+        API endpoint for fuzzer statistics with thread-safe handling.
+        Responses are cached for half the refresh interval, so concurrent
+        clients share a single stats collection. Clients that send the last
+        ETag in If-None-Match get 304 while the snapshot is unchanged.
+        """
+        error = await self._refresh_stats()
+        if error is not None:
+            return error
+
+        headers = {'ETag': _stats_etag(self._stats_version), 'Cache-Control': 'no-cache'}
+        if _if_none_match_version(request) == self._stats_version:
+            return web.Response(status=304, headers=headers)
+        return self._stats_response(request, self._cached_stats_body, headers)
+
+    async def handle_stats_delta(self, request):
+        """
+        Dashboard endpoint returning only the fields and table rows that changed.
+
+        The client sends the ETag of the snapshot it holds in If-None-Match.
+        It gets 304 if that is still current, a delta (with 'base' set) if it
+        holds the previous snapshot, and the full dashboard snapshot otherwise.
+        """
+        error = await self._refresh_stats()
+        if error is not None:
+            return error
+
+        headers = {'ETag': _stats_etag(self._stats_version), 'Cache-Control': 'no-store'}
+        client_version = _if_none_match_version(request)
+        if client_version == self._stats_version:
+            return web.Response(status=304, headers=headers)
+
+        body = self._cached_dashboard_body
+        if self._cached_delta_body is not None and client_version == self._stats_version - 1:
+            body = self._cached_delta_body
+        return self._stats_response(request, body, headers)
+
+    async def handle_ws(self, request):
+        """
+        WebSocket endpoint pushing a dashboard snapshot whenever a new one is
+        collected, instead of the client polling /api/stats/delta.
 
-                # Save state (non-critical)
+        The client may send {"interval": seconds} to receive at most one
+        snapshot per interval.
+        """
+        ws = web.WebSocketResponse(heartbeat=constants.WEB_WS_HEARTBEAT)
+        await ws.prepare(request)
+
+        client = _WsClient(ws, self.refresh_interval)
+        if self._cached_stats_body is not None:
+            client.pending.set()
+        self._ws_clients.add(client)
+        if self._broadcast_task is None or self._broadcast_task.done():
+            self._broadcast_task = asyncio.ensure_future(self._broadcast_loop())
+        sender = asyncio.ensure_future(self._ws_sender(client))
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
                 try:
-                    self.monitor.save_current_state(summary)
-                except Exception:
-                    pass  # State saving is non-critical
-
-                # Format response with FULL suite of information
-                response_data = {
-                    'summary': {
-                        # Fuzzer counts
-                        'total_fuzzers': summary.total_fuzzers,
-                        'alive_fuzzers': summary.alive_fuzzers,
-                        'dead_fuzzers': summary.dead_fuzzers,
-                        'starting_fuzzers': summary.starting_fuzzers,
-
-                        # Runtime
-                        'total_runtime': summary.total_runtime,
-
-                        # Execution stats
-                        'total_execs': summary.total_execs,
-                        'total_speed': summary.total_speed,
-                        'avg_speed_per_core': summary.avg_speed_per_core,
-                        'current_avg_speed': summary.current_avg_speed,
-
-                        # Coverage
-                        'max_coverage': summary.max_coverage,
-
-                        # Findings
-                        'total_crashes': summary.total_crashes,
-                        'total_hangs': summary.total_hangs,
-                        'new_crashes': summary.new_crashes,
-                        'new_hangs': summary.new_hangs,
-
-                        # Corpus stats
-                        'total_corpus': summary.total_corpus,
-                        'total_pending': summary.total_pending,
-                        'total_pending_favs': summary.total_pending_favs,
-
-                        # Last activity
-                        'last_find_time': summary.last_find_time,
-                        'last_crash_time': summary.last_crash_time,
-                        'last_hang_time': summary.last_hang_time,
-
-                        # Cycles
-                        'max_cycle': summary.max_cycle,
-                        'avg_cycle': summary.avg_cycle,
-                        'cycles_wo_finds': summary.cycles_wo_finds,
-
-                        # Stability
-                        'avg_stability': summary.avg_stability,
-                        'min_stability': summary.min_stability,
-                        'max_stability': summary.max_stability,
-
-                        # Advanced metrics
-                        'total_edges_found': summary.total_edges_found,
-                        'max_total_edges': summary.max_total_edges,
-                    },
-                    'system': {
-                        'cpu_count': system_info.get('cpu_count', 0),
-                        'cpu_percent': system_info.get('cpu_percent', 0),
-                        'memory_total_gb': system_info.get('memory_total_gb', 0),
-                        'memory_used_gb': system_info.get('memory_used_gb', 0),
-                        'memory_percent': system_info.get('memory_percent', 0),
-                        'disk_total_gb': system_info.get('disk_total_gb', 0),
-                        'disk_used_gb': system_info.get('disk_used_gb', 0),
-                        'disk_percent': system_info.get('disk_percent', 0),
-                    },
-                    'fuzzers': [
-                        {
-                            'name': stats.fuzzer_name,
-                            'status': stats.status.value if hasattr(stats.status, 'value') else str(stats.status),
-                            'run_time': stats.run_time,
-                            'execs_done': stats.execs_done,
-                            'exec_speed': stats.execs_per_sec,
-                            'bitmap_cvg': stats.bitmap_cvg,
-                            'saved_crashes': stats.saved_crashes,
-                            'saved_hangs': stats.saved_hangs,
-                            'corpus_count': stats.corpus_count,
-                            'stability': stats.stability,
-                            'cpu_percent': stats.cpu_usage,
-                            'memory_percent': stats.memory_usage,
-                            'slowest_exec_ms': stats.slowest_exec_ms,
-                            'exec_timeout': stats.exec_timeout,
-                        }
-                        for stats in all_stats
-                    ]
-                }
+                    client.interval = max(float(orjson.loads(msg.data)['interval']), 0.0)
+                except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+                    logging.debug("Ignoring WebSocket message: %r", msg.data[:100])
+        finally:
+            self._ws_clients.discard(client)
+            sender.cancel()
+        return ws
 
-                return web.json_response(response_data)
+    async def _ws_sender(self, client: _WsClient):
+        """
+        Send one client the newest snapshot, no more often than it asked for.
 
-            except Exception as e:
-                logging.error(f"Unexpected error in stats endpoint: {e}")
-                return web.json_response(
-                    {'error': 'Internal server error', 'detail': str(e)},
-                    status=500
-                )
+        All clients share the same serialized bodies: those holding the
+        previous version get the delta, everyone else the full snapshot.
+        """
+        last_sent = 0.0
+        try:
+            while True:
+                await client.pending.wait()
+                wait = client.interval - (time.monotonic() - last_sent)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                client.pending.clear()
+
+                version = self._stats_version
+                if self._cached_delta_body is not None and client.version == version - 1:
+                    body = self._cached_delta_body
+                else:
+                    body = self._cached_dashboard_body
+                client.version = version
+                await client.ws.send_bytes(body)
+                last_sent = time.monotonic()
+        except (ConnectionError, RuntimeError) as e:
+            logging.debug("WebSocket client went away: %r", e)
+            await client.ws.close()
+
+    async def _broadcast_loop(self):
+        """
+        Single producer for all WebSocket clients: collect stats once per
+        refresh interval while any client is connected and wake their senders.
+        """
+        while self._ws_clients:
+            await self._refresh_stats()
+            version = self._stats_version
+            if self._cached_stats_body is not None:
+                for client in self._ws_clients:
+                    if client.version != version:
+                        client.pending.set()
+            await asyncio.sleep(self.refresh_interval)
+        self._broadcast_task = None
+
+    async def _close_websockets(self, app):
+        """Stop the broadcast task and close open dashboard WebSockets on shutdown."""
+        task = self._broadcast_task
+        if task is not None:
+            self._broadcast_task = None
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        for client in list(self._ws_clients):
+            await client.ws.close(code=WSCloseCode.GOING_AWAY, message=b'Server shutdown')
+
+    async def _close_monitor(self, app):
+        """Flush the campaign state and stop the monitor's worker threads once the server is done."""
+        self._save_state()
+        self.monitor.close()
+
+
+def new_event_loop(use_uvloop: bool = True) -> asyncio.AbstractEventLoop:
+    """
+    Create an event loop for the web server, using uvloop when it is installed and allowed.
 
+    The one place the loop implementation is chosen, for both launch modes;
+    run the server through run_event_loop() rather than calling this directly.
+    """
+    if use_uvloop and uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run_event_loop(main, use_uvloop: bool = True):
+    """
+    Run a coroutine to completion on a loop from new_event_loop(), then close the loop.
 
-def _run_web_server_in_thread(findings_dir: Path, port: int, refresh_interval: int):
-    """Run web server in background thread with its own event loop."""
-    # Create new event loop for this thread
-    loop = asyncio.new_event_loop()
+    Like asyncio.run(), tasks still pending when main finishes (or is interrupted)
+    are cancelled and allowed to clean up first.
+    """
+    loop = new_event_loop(use_uvloop)
     asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
 
-    server = WebServer(findings_dir, refresh_interval)
+
+async def _wait_for_shutdown():
+    """Wait until SIGINT or SIGTERM is delivered to this process."""
+    loop = asyncio.get_running_loop()
+    stop = loop.create_future()
+
+    def _request_stop():
+        if not stop.done():
+            stop.set_result(None)
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _request_stop)
+        except (NotImplementedError, RuntimeError):
+            pass  # No loop signal handlers (Windows); Ctrl+C still raises KeyboardInterrupt
+    await stop
+
+
+def _run_web_server_process(
+    findings_dir: Path, port: int, refresh_interval: int, use_uvloop: bool = True,
+    log_level: int = logging.ERROR
+):
+    """Run web server in a background process with its own event loop."""
+    # A spawned child starts with unconfigured logging; apply the CLI's level so
+    # warnings don't leak onto the terminal the TUI owns
+    logging.basicConfig(level=log_level)
 
     async def _start_server():
-        runner = web.AppRunner(server.app)
+        server = WebServer(findings_dir, refresh_interval)
+        runner = web.AppRunner(
+            server.app,
+            keepalive_timeout=constants.WEB_KEEPALIVE_TIMEOUT,
+            access_log_class=_DashboardAccessLogger,
+        )
         await runner.setup()
 
         try:
@@ -1384,8 +2138,8 @@ def _run_web_server_in_thread(findings_dir: Path, port: int, refresh_interval: i
             print(f"   Mode:     With TUI")
             print(f"   Refresh:  {refresh_interval}s\n")
 
-            # Keep running until interrupted
-            await asyncio.Event().wait()
+            # Keep running until the parent terminates us (or Ctrl+C)
+            await _wait_for_shutdown()
         except OSError as e:
             if "Address already in use" in str(e) or "Errno 98" in str(e):
                 print(f"\nError: Port {port} is already in use")
@@ -1397,33 +2151,39 @@ def _run_web_server_in_thread(findings_dir: Path, port: int, refresh_interval: i
             await runner.cleanup()
 
     try:
-        loop.run_until_complete(_start_server())
+        run_event_loop(_start_server(), use_uvloop)
+    except KeyboardInterrupt:
+        pass  # Ctrl+C reaches the whole process group; the parent reports shutdown
     except Exception as e:
         logging.error(f"Web server error: {e}")
-    finally:
-        loop.close()
 
 
 def start_web_server_background(
     findings_dir: Path,
     port: int = 8080,
-    refresh_interval: int = 5
-) -> threading.Thread:
+    refresh_interval: int = 5,
+    use_uvloop: bool = True,
+    log_level: int = logging.ERROR
+) -> multiprocessing.Process:
     """
-    Start web server in a background thread.
+    Start web server in a background (spawned) process.
+
+    Keeps request handling off the GIL used by the TUI in the main process.
+    Pass use_uvloop=False to run it on the standard asyncio loop (e.g. for debugging).
+    log_level is applied to the child's logging, which does not inherit the caller's.
 
-    Returns the thread object so caller can manage it.
+    Returns the process object so caller can manage it.
     """
-    web_thread = threading.Thread(
-        target=_run_web_server_in_thread,
-        args=(findings_dir, port, refresh_interval),
+    ctx = multiprocessing.get_context('spawn')
+    web_process = ctx.Process(
+        target=_run_web_server_process,
+        args=(findings_dir, port, refresh_interval, use_uvloop, log_level),
         daemon=True
     )
-    web_thread.start()
+    web_process.start()
     # Give web server a moment to start
-    import time
     time.sleep(1)
-    return web_thread
+    return web_process
 
 
 async def run_web_server(
@@ -1454,7 +2214,11 @@ async def run_web_server(
     server = WebServer(findings_dir, refresh_interval)
 
     try:
-        runner = web.AppRunner(server.app)
+        runner = web.AppRunner(
+            server.app,
+            keepalive_timeout=constants.WEB_KEEPALIVE_TIMEOUT,
+            access_log_class=_DashboardAccessLogger,
+        )
         await runner.setup()
 
         try:
@@ -1479,8 +2243,7 @@ async def run_web_server(
 
         # Keep server running in headless mode
         try:
-            await asyncio.Event().wait()
-        except KeyboardInterrupt:
+            await _wait_for_shutdown()
             print("\n\nShutting down...\n")
         finally:
             await runner.cleanup()
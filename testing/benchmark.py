@@ -12,75 +12,22 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.models import MonitorConfig
 from src.monitor import AFLMonitor
 
+from create_mock_fuzzing import create_fuzzer_stats
+
 def create_large_mock_environment(sync_dir: Path, num_fuzzers: int):
     """Create a mock environment with many fuzzers."""
-    import random
-
     sync_dir.mkdir(parents=True, exist_ok=True)
 
     # Use actual running PIDs to make fuzzers appear alive
     current_pid = os.getpid()
+    current_time = int(time.time())
 
     for i in range(num_fuzzers):
         fuzzer_name = f"fuzzer{i:03d}"
         fuzzer_dir = sync_dir / fuzzer_name
         fuzzer_dir.mkdir(exist_ok=True)
 
-        current_time = int(time.time())
-        start_time = current_time - random.randint(3600, 36000)
-
-        # Use current PID to make it seem alive
-        stats_content = f"""start_time        : {start_time}
-last_update       : {current_time}
-run_time          : {current_time - start_time}
-fuzzer_pid        : {current_pid}
-cycles_done       : {random.randint(5, 50)}
-cycles_wo_finds   : {random.randint(0, 15)}
-execs_done        : {random.randint(100000, 5000000)}
-execs_per_sec     : {random.uniform(200, 1500):.2f}
-execs_ps_last_min : {random.uniform(180, 1600):.2f}
-corpus_count      : {random.randint(50, 500)}
-corpus_favored    : {random.randint(20, 200)}
-corpus_found      : {random.randint(50, 500)}
-corpus_imported   : 0
-max_depth         : {random.randint(3, 10)}
-cur_item          : {random.randint(0, 400)}
-pending_favs      : {random.randint(0, 50)}
-pending_total     : {random.randint(0, 100)}
-bitmap_cvg        : {random.uniform(5.0, 45.0):.2f}%
-saved_crashes     : {random.randint(0, 10)}
-saved_hangs       : {random.randint(0, 3)}
-last_find         : {current_time - random.randint(60, 3600)}
-last_crash        : {current_time - random.randint(600, 7200)}
-last_hang         : 0
-exec_timeout      : 1000
-afl_banner        : {fuzzer_name}
-afl_version       : 4.09c
-target_mode       : default
-slowest_exec_ms   : {random.randint(50, 200)}
-peak_rss_mb       : {random.randint(50, 300)}
-cpu_affinity      : {random.randint(0, 15)}
-edges_found       : {random.randint(1000, 5000)}
-total_edges       : {random.randint(5000, 10000)}
-var_byte_count    : {random.randint(100, 1000)}
-havoc_expansion   : {random.randint(10, 100)}
-auto_dict_entries : {random.randint(0, 50)}
-testcache_size    : 50
-testcache_count   : {random.randint(0, 50)}
-testcache_evict   : {random.randint(0, 20)}
-stability         : {random.uniform(85.0, 99.9):.2f}%
-total_tmout       : {random.randint(0, 100)}
-time_wo_finds     : {random.randint(0, 1800)}
-fuzz_time         : {current_time - start_time - random.randint(0, 3600)}
-calibration_time  : {random.randint(0, 300)}
-cmplog_time       : 0
-sync_time         : {random.randint(0, 600)}
-trim_time         : {random.randint(0, 300)}
-execs_since_crash : {random.randint(10000, 500000)}
-"""
-
-        with open(fuzzer_dir / "fuzzer_stats", 'w') as f:
-            f.write(stats_content)
+        create_fuzzer_stats(fuzzer_dir, fuzzer_name, current_pid, current_time)
 
 def benchmark_collection(num_fuzzers: int, num_runs: int = 5):
     """Benchmark stats collection."""
@@ -5,65 +5,122 @@ import os
 import time
 import random
 from pathlib import Path
-
-def create_fuzzer_stats(fuzzer_dir: Path, fuzzer_name: str, pid: int):
+from typing import Optional
+
+def write_file(path: Path, data: bytes = b""):
+    """Create or truncate a file and write data without a Python file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if data:
+            os.write(fd, data)
+    finally:
+        os.close(fd)
+
+_STATS_TEMPLATE = (
+    "start_time        : %(start_time)d\n"
+    "last_update       : %(last_update)d\n"
+    "run_time          : %(run_time)d\n"
+    "fuzzer_pid        : %(fuzzer_pid)d\n"
+    "cycles_done       : %(cycles_done)d\n"
+    "cycles_wo_finds   : %(cycles_wo_finds)d\n"
+    "execs_done        : %(execs_done)d\n"
+    "execs_per_sec     : %(execs_per_sec).2f\n"
+    "execs_ps_last_min : %(execs_ps_last_min).2f\n"
+    "corpus_count      : %(corpus_count)d\n"
+    "corpus_favored    : %(corpus_favored)d\n"
+    "corpus_found      : %(corpus_found)d\n"
+    "corpus_imported   : 0\n"
+    "max_depth         : %(max_depth)d\n"
+    "cur_item          : %(cur_item)d\n"
+    "pending_favs      : %(pending_favs)d\n"
+    "pending_total     : %(pending_total)d\n"
+    "bitmap_cvg        : %(bitmap_cvg).2f%%\n"
+    "saved_crashes     : %(saved_crashes)d\n"
+    "saved_hangs       : %(saved_hangs)d\n"
+    "last_find         : %(last_find)d\n"
+    "last_crash        : %(last_crash)d\n"
+    "last_hang         : 0\n"
+    "exec_timeout      : 1000\n"
+    "afl_banner        : %(afl_banner)s\n"
+    "afl_version       : 4.09c\n"
+    "target_mode       : default\n"
+    "command_line      : afl-fuzz -i input -o sync -M %(fuzzer_name)s -- ./target\n"
+    "slowest_exec_ms   : %(slowest_exec_ms)d\n"
+    "peak_rss_mb       : %(peak_rss_mb)d\n"
+    "cpu_affinity      : %(cpu_affinity)d\n"
+    "edges_found       : %(edges_found)d\n"
+    "total_edges       : %(total_edges)d\n"
+    "var_byte_count    : %(var_byte_count)d\n"
+    "havoc_expansion   : %(havoc_expansion)d\n"
+    "auto_dict_entries : %(auto_dict_entries)d\n"
+    "testcache_size    : 50\n"
+    "testcache_count   : %(testcache_count)d\n"
+    "testcache_evict   : %(testcache_evict)d\n"
+    "stability         : %(stability).2f%%\n"
+    "total_tmout       : %(total_tmout)d\n"
+    "time_wo_finds     : %(time_wo_finds)d\n"
+    "fuzz_time         : %(fuzz_time)d\n"
+    "calibration_time  : %(calibration_time)d\n"
+    "cmplog_time       : 0\n"
+    "sync_time         : %(sync_time)d\n"
+    "trim_time         : %(trim_time)d\n"
+    "execs_since_crash : %(execs_since_crash)d\n"
+)
+
+def create_fuzzer_stats(fuzzer_dir: Path, fuzzer_name: str, pid: int,
+                        current_time: Optional[int] = None):
     """Create a realistic fuzzer_stats file."""
-    current_time = int(time.time())
-    start_time = current_time - random.randint(3600, 36000)
-
-    stats_content = f"""start_time        : {start_time}
-last_update       : {current_time}
-run_time          : {current_time - start_time}
-fuzzer_pid        : {pid}
-cycles_done       : {random.randint(5, 50)}
-cycles_wo_finds   : {random.randint(0, 15)}
-execs_done        : {random.randint(100000, 5000000)}
-execs_per_sec     : {random.uniform(200, 1500):.2f}
-execs_ps_last_min : {random.uniform(180, 1600):.2f}
-corpus_count      : {random.randint(50, 500)}
-corpus_favored    : {random.randint(20, 200)}
-corpus_found      : {random.randint(50, 500)}
-corpus_imported   : 0
-max_depth         : {random.randint(3, 10)}
-cur_item          : {random.randint(0, 400)}
-pending_favs      : {random.randint(0, 50)}
-pending_total     : {random.randint(0, 100)}
-bitmap_cvg        : {random.uniform(5.0, 45.0):.2f}%
-saved_crashes     : {random.randint(0, 10)}
-saved_hangs       : {random.randint(0, 3)}
-last_find         : {current_time - random.randint(60, 3600)}
-last_crash        : {current_time - random.randint(600, 7200)}
-last_hang         : 0
-exec_timeout      : 1000
-afl_banner        : {fuzzer_name}
-afl_version       : 4.09c
-target_mode       : default
-command_line      : afl-fuzz -i input -o sync -M {fuzzer_name} -- ./target
-slowest_exec_ms   : {random.randint(50, 200)}
-peak_rss_mb       : {random.randint(50, 300)}
-cpu_affinity      : {random.randint(0, 15)}
-edges_found       : {random.randint(1000, 5000)}
-total_edges       : {random.randint(5000, 10000)}
-var_byte_count    : {random.randint(100, 1000)}
-havoc_expansion   : {random.randint(10, 100)}
-auto_dict_entries : {random.randint(0, 50)}
-testcache_size    : 50
-testcache_count   : {random.randint(0, 50)}
-testcache_evict   : {random.randint(0, 20)}
-stability         : {random.uniform(85.0, 99.9):.2f}%
-total_tmout       : {random.randint(0, 100)}
-time_wo_finds     : {random.randint(0, 1800)}
-fuzz_time         : {current_time - start_time - random.randint(0, 3600)}
-calibration_time  : {random.randint(0, 300)}
-cmplog_time       : 0
-sync_time         : {random.randint(0, 600)}
-trim_time         : {random.randint(0, 300)}
-execs_since_crash : {random.randint(10000, 500000)}
-"""
-
-    stats_file = fuzzer_dir / "fuzzer_stats"
-    with open(stats_file, 'w') as f:
-        f.write(stats_content)
+    if current_time is None:
+        current_time = int(time.time())
+    randint = random.randint
+    uniform = random.uniform
+    start_time = current_time - randint(3600, 36000)
+
+    stats_content = _STATS_TEMPLATE % {
+        'fuzzer_name': fuzzer_name,
+        'start_time': start_time,
+        'last_update': current_time,
+        'run_time': current_time - start_time,
+        'fuzzer_pid': pid,
+        'cycles_done': randint(5, 50),
+        'cycles_wo_finds': randint(0, 15),
+        'execs_done': randint(100000, 5000000),
+        'execs_per_sec': uniform(200, 1500),
+        'execs_ps_last_min': uniform(180, 1600),
+        'corpus_count': randint(50, 500),
+        'corpus_favored': randint(20, 200),
+        'corpus_found': randint(50, 500),
+        'max_depth': randint(3, 10),
+        'cur_item': randint(0, 400),
+        'pending_favs': randint(0, 50),
+        'pending_total': randint(0, 100),
+        'bitmap_cvg': uniform(5.0, 45.0),
+        'saved_crashes': randint(0, 10),
+        'saved_hangs': randint(0, 3),
+        'last_find': current_time - randint(60, 3600),
+        'last_crash': current_time - randint(600, 7200),
+        'afl_banner': fuzzer_name,
+        'slowest_exec_ms': randint(50, 200),
+        'peak_rss_mb': randint(50, 300),
+        'cpu_affinity': randint(0, 15),
+        'edges_found': randint(1000, 5000),
+        'total_edges': randint(5000, 10000),
+        'var_byte_count': randint(100, 1000),
+        'havoc_expansion': randint(10, 100),
+        'auto_dict_entries': randint(0, 50),
+        'testcache_count': randint(0, 50),
+        'testcache_evict': randint(0, 20),
+        'stability': uniform(85.0, 99.9),
+        'total_tmout': randint(0, 100),
+        'time_wo_finds': randint(0, 1800),
+        'fuzz_time': current_time - start_time - randint(0, 3600),
+        'calibration_time': randint(0, 300),
+        'sync_time': randint(0, 600),
+        'trim_time': randint(0, 300),
+        'execs_since_crash': randint(10000, 500000),
+    }
+
+    write_file(fuzzer_dir / "fuzzer_stats", stats_content.encode())
 
 def create_plot_data(fuzzer_dir: Path):
     """Create a realistic plot_data file."""
@@ -92,8 +149,7 @@ def create_plot_data(fuzzer_dir: Path):
         line = f"{rel_time}, {cycles}, {cur_item}, {corpus}, {pending_total}, {pending_favs}, {map_size:.2f}%, {crashes}, {hangs}, {depth}, {speed:.2f}, {total_execs}, {edges}, {total_crashes}, {servers}\n"
         lines.append(line)
 
-    with open(plot_file, 'w') as f:
-        f.writelines(lines)
+    write_file(plot_file, "".join(lines).encode())
 
 def create_mock_environment(sync_dir: Path, num_slaves: int = 3):
     """Create a complete mock fuzzing environment."""
@@ -120,7 +176,7 @@ def create_mock_environment(sync_dir: Path, num_slaves: int = 3):
 
     # Create dummy queue files
     for i in range(10):
-        (master_dir / "queue" / f"id:{i:06d},src:000000,time:0,execs:0").touch()
+        write_file(master_dir / "queue" / f"id:{i:06d},src:000000,time:0,execs:0")
 
     # Create slave fuzzers
     for i in range(num_slaves):
@@ -137,7 +193,7 @@ def create_mock_environment(sync_dir: Path, num_slaves: int = 3):
         (slave_dir / "hangs").mkdir(exist_ok=True)
 
         for j in range(8):
-            (slave_dir / "queue" / f"id:{j:06d},src:000000,time:0,execs:0").touch()
+            write_file(slave_dir / "queue" / f"id:{j:06d},src:000000,time:0,execs:0")
 
     print(f"\nMock environment created successfully!")
     print(f"Total fuzzers: 1 master + {num_slaves} slaves")